@@ -4,7 +4,7 @@
 import os
 import json
 import requests
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from jose import jwt
 from jose.exceptions import JWTError, ExpiredSignatureError
 from fastapi import APIRouter, HTTPException, Depends
@@ -42,7 +42,7 @@ _JWKS_CACHE_TTL = 3600  # 1 hour
 def get_jwks():
     """Fetch and cache JWKS keys from Supabase."""
     global _JWKS_CACHE, _JWKS_LAST_FETCH
-    now = datetime.utcnow()
+    now = datetime.now(timezone.utc)
     if _JWKS_CACHE and _JWKS_LAST_FETCH and (now - _JWKS_LAST_FETCH).seconds < _JWKS_CACHE_TTL:
         return _JWKS_CACHE
     try:
@@ -152,7 +152,7 @@ def get_current_user_optional(credentials: HTTPAuthorizationCredentials = Depend
 def create_local_token(data: dict, expires_minutes: int = 120):
     """Generate HS256 token (internal use)."""
     to_encode = data.copy()
-    expire = datetime.utcnow() + timedelta(minutes=expires_minutes)
+    expire = datetime.now(timezone.utc) + timedelta(minutes=expires_minutes)
     to_encode.update({"exp": expire})
     return jwt.encode(to_encode, SUPABASE_JWT_SECRET, algorithm="HS256")
 
@@ -5,9 +5,11 @@ Provides db_insert_job / db_update_job / db_get_jobs interface expected by serve
 """
 
 import os
-import json
+import copy
 import datetime
+import threading
 from typing import List, Dict, Any, Optional
+import orjson
 from supabase import create_client, Client
 
 # -------------------------------------------------------------------
@@ -18,12 +20,14 @@ SUPABASE_KEY = os.getenv("SUPABASE_SERVICE_KEY") or os.getenv("SUPABASE_ANON_KEY
 
 # Local fallback file for development
 LOCAL_JOBS_FILE = os.path.join(os.getcwd(), "jobs.json")
+# Serializes read-modify-write of LOCAL_JOBS_FILE across threads (e.g. worker job threads)
+_local_lock = threading.Lock()
 
 
 def _ensure_local_json():
     if not os.path.exists(LOCAL_JOBS_FILE):
-        with open(LOCAL_JOBS_FILE, "w") as f:
-            json.dump([], f)
+        with open(LOCAL_JOBS_FILE, "wb") as f:
+            f.write(orjson.dumps([]))
 
 
 _ensure_local_json()
@@ -41,20 +45,57 @@ else:
 # Utilities
 # -------------------------------------------------------------------
 def now_iso() -> str:
-    return datetime.datetime.utcnow().replace(tzinfo=datetime.timezone.utc).isoformat()
+    return datetime.datetime.now(datetime.timezone.utc).isoformat()
 
 
 def _read_local_jobs() -> List[Dict[str, Any]]:
     try:
-        with open(LOCAL_JOBS_FILE, "r") as f:
-            return json.load(f)
+        with open(LOCAL_JOBS_FILE, "rb") as f:
+            return orjson.loads(f.read())
     except Exception:
         return []
 
 
 def _write_local_jobs(jobs: List[Dict[str, Any]]):
-    with open(LOCAL_JOBS_FILE, "w") as f:
-        json.dump(jobs, f, indent=2)
+    global _local_index, _local_index_stamp
+    # encode first, then write-then-rename: a concurrent reader never parses a
+    # half-written file, and a failed encode or write leaves no stray temp file
+    data = orjson.dumps(jobs, option=orjson.OPT_NON_STR_KEYS)
+    tmp = f"{LOCAL_JOBS_FILE}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, LOCAL_JOBS_FILE)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+    _local_index = {str(j.get("id")): dict(j) for j in jobs}
+    _local_index_stamp = _local_stamp()
+
+
+# id -> job index over LOCAL_JOBS_FILE; rebuilt only when the file changes
+_local_index: Dict[str, Dict[str, Any]] = {}
+_local_index_stamp: Optional[tuple] = None
+
+
+def _local_stamp() -> Optional[tuple]:
+    try:
+        st = os.stat(LOCAL_JOBS_FILE)
+    except OSError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def _local_job_index() -> Dict[str, Dict[str, Any]]:
+    global _local_index, _local_index_stamp
+    stamp = _local_stamp()
+    if stamp != _local_index_stamp:
+        _local_index = {str(j.get("id")): j for j in _read_local_jobs()}
+        _local_index_stamp = stamp
+    return _local_index
 
 
 # -------------------------------------------------------------------
@@ -68,10 +109,11 @@ def db_insert_job(data: Dict[str, Any]) -> Dict[str, Any]:
             return result.data[0]
         raise RuntimeError(f"Failed to insert job: {result}")
     else:
-        jobs = _read_local_jobs()
-        data["id"] = len(jobs) + 1
-        jobs.append(data)
-        _write_local_jobs(jobs)
+        with _local_lock:
+            jobs = _read_local_jobs()
+            data["id"] = len(jobs) + 1
+            jobs.append(data)
+            _write_local_jobs(jobs)
         return data
 
 
@@ -84,12 +126,13 @@ def db_update_job(job_id: str, patch: Dict[str, Any]) -> Dict[str, Any]:
             return result.data[0]
         raise RuntimeError(f"Update failed for job {job_id}")
     else:
-        jobs = _read_local_jobs()
-        for j in jobs:
-            if str(j.get("id")) == str(job_id):
-                j.update(patch)
-                _write_local_jobs(jobs)
-                return j
+        with _local_lock:
+            jobs = _read_local_jobs()
+            for j in jobs:
+                if str(j.get("id")) == str(job_id):
+                    j.update(patch)
+                    _write_local_jobs(jobs)
+                    return j
         raise RuntimeError(f"Job not found locally: {job_id}")
 
 
@@ -105,9 +148,30 @@ def db_get_jobs(limit: int = 100) -> List[Dict[str, Any]]:
         )
         return result.data or []
     else:
+        # inserts append, so the file is already oldest -> newest
         jobs = _read_local_jobs()
-        jobs.sort(key=lambda j: j.get("created_at", ""), reverse=True)
-        return jobs[-limit:]
+        return jobs[-limit:][::-1] if limit > 0 else []
+
+
+def claim_next_job() -> Optional[Dict[str, Any]]:
+    """
+    Claim the oldest queued job in one round trip (SELECT ... FOR UPDATE SKIP LOCKED).
+    Returns the claimed record, or None if nothing is queued.
+    """
+    if supabase:
+        result = supabase.rpc("claim_next_job", {}).execute()
+        return result.data[0] if result.data else None
+    else:
+        ts = now_iso()
+        with _local_lock:
+            jobs = _read_local_jobs()
+            # inserts append, so the first queued job is the oldest
+            job = next((j for j in jobs if j.get("status") == "queued"), None)
+            if job is None:
+                return None
+            job.update({"status": "processing", "claimed_at": ts, "updated_at": ts})
+            _write_local_jobs(jobs)
+            return job
 
 
 def get_job(job_id: str) -> Optional[Dict[str, Any]]:
@@ -116,11 +180,9 @@ def get_job(job_id: str) -> Optional[Dict[str, Any]]:
         result = supabase.table("jobs").select("*").eq("id", job_id).execute()
         return result.data[0] if result.data else None
     else:
-        jobs = _read_local_jobs()
-        for j in jobs:
-            if str(j.get("id")) == str(job_id):
-                return j
-        return None
+        job = _local_job_index().get(str(job_id))
+        # deep copy: callers may mutate nested fields (payload) without touching the index
+        return copy.deepcopy(job) if job else None
 
 
 # -------------------------------------------------------------------
@@ -133,14 +195,15 @@ def create_job(
     file_url: Optional[str] = None,
 ):
     """Create and store a new job (supports file_url)."""
+    ts = now_iso()
     data = {
         "user_id": user_id,
         "filename": filename,
         "status": "queued",
         "progress": 0,
         "payload": payload or {},
-        "created_at": now_iso(),
-        "updated_at": now_iso(),
+        "created_at": ts,
+        "updated_at": ts,
     }
 
     if file_url:
@@ -1,12 +1,15 @@
 # email_generator.py
 import os, random, json
+from functools import lru_cache
 from openai import OpenAI
 
 MODEL = os.getenv("OPENAI_MODEL", "gpt-4o")
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 _client = OpenAI(api_key=OPENAI_API_KEY) if OPENAI_API_KEY else None
 
+@lru_cache(maxsize=8)
 def load_weclick_config(config_name: str = "weclick") -> dict:
+    # cached per process (compose_email runs once per lead); treat the result as read-only
     path = os.path.join("configs", f"{config_name}.json")
     with open(path, "r", encoding="utf-8") as f:
         return json.load(f)
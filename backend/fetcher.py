@@ -1,14 +1,16 @@
 import time
 from typing import List, Tuple
 import tldextract
-import requests
 from bs4 import BeautifulSoup
+from .http_session import make_session
 from .parser import html_to_text
 
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (compatible; OutreachAgent/1.0; +https://example.com/agent)"
 }
 
+SESSION = make_session(HEADERS)
+
 def normalize_url(url: str) -> str:
     if not url:
         return ""
@@ -24,7 +26,7 @@ def same_domain(url: str, base: str) -> bool:
 
 def fetch(url: str, timeout: int = 12) -> str:
     try:
-        resp = requests.get(url, headers=HEADERS, timeout=timeout)
+        resp = SESSION.get(url, timeout=timeout)
         if resp.status_code != 200:
             return ""
         return resp.text
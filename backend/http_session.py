@@ -0,0 +1,24 @@
+# http_session.py
+"""
+Shared HTTP session factory for the fetcher and LinkedIn helpers.
+"""
+
+from http.cookiejar import DefaultCookiePolicy
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+def make_session(headers: dict) -> requests.Session:
+    """
+    Pooled keep-alive session: repeat hosts skip the TCP/TLS handshake.
+    Cookies are never stored, so requests stay stateless like plain requests.get and
+    no state leaks between leads or between concurrent job threads.
+    """
+    session = requests.Session()
+    session.headers.update(headers)
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
@@ -11,6 +11,8 @@ import requests
 from bs4 import BeautifulSoup
 from typing import List, Dict, Optional
 
+from http_session import make_session
+
 HEADERS = {
     "User-Agent": (
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
@@ -19,6 +21,8 @@ HEADERS = {
     )
 }
 
+SESSION = make_session(HEADERS)
+
 def _clean_linkedin_url(raw_url: str) -> str:
     """Ensure we return a clean LinkedIn URL (no redirect wrappers or params)."""
     if not raw_url:
@@ -49,7 +53,7 @@ def find_linkedin_profile(name: str, company: str = "") -> Optional[str]:
 
     for attempt in range(2):  # retry once
         try:
-            r = requests.get(url, headers=HEADERS, timeout=12)
+            r = SESSION.get(url, timeout=12)
             r.raise_for_status()
             soup = BeautifulSoup(r.text, "html.parser")
             for a in soup.select("a.result__a[href]"):
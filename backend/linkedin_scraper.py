@@ -12,6 +12,8 @@ import requests
 from bs4 import BeautifulSoup
 from typing import Dict, List, Optional
 
+from http_session import make_session
+
 HEADERS = {
     "User-Agent": (
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
@@ -20,6 +22,8 @@ HEADERS = {
     )
 }
 
+SESSION = make_session(HEADERS)
+
 JINA_PROXY_PREFIX = "https://r.jina.ai/http://"
 
 # -------------------------------------------------------------------
@@ -31,7 +35,7 @@ def fetch_profile_text(linkedin_url: str) -> str:
         return ""
     proxied = JINA_PROXY_PREFIX + linkedin_url.replace("https://", "").replace("http://", "")
     try:
-        r = requests.get(proxied, headers=HEADERS, timeout=15)
+        r = SESSION.get(proxied, timeout=15)
         r.raise_for_status()
         return r.text
     except Exception as e:
@@ -70,7 +74,7 @@ def find_recent_posts(name: str, company: str = "") -> List[Dict[str, str]]:
     url = f"https://duckduckgo.com/html/?q={requests.utils.quote(q)}"
     posts = []
     try:
-        r = requests.get(url, headers=HEADERS, timeout=12)
+        r = SESSION.get(url, timeout=12)
         r.raise_for_status()
         soup = BeautifulSoup(r.text, "html.parser")
         for a in soup.select("a.result__a[href]"):
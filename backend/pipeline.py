@@ -16,6 +16,14 @@ from linkedin_scraper import scrape_profiles
 from summarizer import summarize_profiles
 from email_generator import generate_emails
 
+POST_COLUMNS = ["post_1", "post_2", "post_3"]
+
+
+def _post_snippets(posts: Any) -> List[str]:
+    """First len(POST_COLUMNS) post snippets, padded with blanks."""
+    snippets = [p["snippet"] for p in posts[: len(POST_COLUMNS)]] if isinstance(posts, list) else []
+    return snippets + [""] * (len(POST_COLUMNS) - len(snippets))
+
 
 def run_pipeline(input_path: str, job_id: str, output_dir: str = "outputs") -> str:
     """
@@ -52,10 +60,10 @@ def run_pipeline(input_path: str, job_id: str, output_dir: str = "outputs") -> s
         df = pd.DataFrame(emails)
 
         # Expand list fields (like posts) into separate columns for clarity
+        # (one pass over the rows, then whole-column assignment)
         if "posts" in df.columns:
-            df["post_1"] = df["posts"].apply(lambda p: p[0]["snippet"] if isinstance(p, list) and len(p) > 0 else "")
-            df["post_2"] = df["posts"].apply(lambda p: p[1]["snippet"] if isinstance(p, list) and len(p) > 1 else "")
-            df["post_3"] = df["posts"].apply(lambda p: p[2]["snippet"] if isinstance(p, list) and len(p) > 2 else "")
+            snippets = [_post_snippets(p) for p in df["posts"]]
+            df[POST_COLUMNS] = pd.DataFrame(snippets, columns=POST_COLUMNS, index=df.index)
             df.drop(columns=["posts"], inplace=True, errors="ignore")
 
         df.to_excel(output_path, index=False)
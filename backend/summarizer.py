@@ -1,5 +1,6 @@
 import os, json
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Optional
 from tenacity import retry, stop_after_attempt, wait_exponential
 from openai import OpenAI
 
@@ -26,12 +27,17 @@ def format_prompt(pages: List[Dict[str, str]], client_name: str, enrichment: str
     sources = build_sources(pages)
     return template.format(client_name=client_name, sources=sources)
 
+@lru_cache(maxsize=1)
+def _openai_client() -> Optional[OpenAI]:
+    # read the key and build the HTTP client once, not per summarized row
+    api_key = os.getenv("OPENAI_API_KEY")
+    return OpenAI(api_key=api_key) if api_key else None
+
 @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=8))
 def call_openai(prompt: str) -> Dict:
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
+    client = _openai_client()
+    if client is None:
         return {"company_focus":"Unknown","recent_activity":"Unknown","positioning_hook":"General benefits"}
-    client = OpenAI(api_key=api_key)
     resp = client.chat.completions.create(
         model="gpt-4o-mini",
         messages=[{"role":"user","content":prompt}],
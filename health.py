@@ -1,11 +1,14 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 
 router = APIRouter()
 
+# Encoded once: probes do no serialization, DB or disk work
+_HEALTH_BODY = b'{"status":"ok"}'
+
 @router.get("/health")
-def health_check():
+async def health_check():
     """
     Lightweight health check endpoint.
     Used by Render or uptime monitors to confirm the app is alive.
     """
-    return {"status": "ok"}
\ No newline at end of file
+    return Response(content=_HEALTH_BODY, media_type="application/json")
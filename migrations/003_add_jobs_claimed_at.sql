@@ -0,0 +1,7 @@
+-- Supabase migration: record when a worker claimed a job
+-- Set by the claim_next_job RPC (004) when it moves a job queued -> processing;
+-- the (status, created_at) index serves its oldest-queued lookup.
+alter table public.jobs add column if not exists claimed_at timestamptz;
+
+create index if not exists jobs_status_created_at_idx
+  on public.jobs (status, created_at);
@@ -0,0 +1,19 @@
+-- Supabase migration: atomic "claim the oldest queued job" for workers
+-- Called via supabase.rpc("claim_next_job") from backend/db_helper.claim_next_job.
+-- SKIP LOCKED lets concurrent workers each take a different row in one round trip.
+create or replace function public.claim_next_job()
+returns setof public.jobs
+language sql
+as $$
+  update public.jobs
+     set status = 'processing', claimed_at = now(), updated_at = now()
+   where id = (
+     select id
+       from public.jobs
+      where status = 'queued'
+      order by created_at
+      limit 1
+      for update skip locked
+   )
+  returning *;
+$$;
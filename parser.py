@@ -1,6 +1,7 @@
 # parser.py
 from __future__ import annotations
 
+import csv
 import os
 from typing import List, Dict, Any
 import pandas as pd
@@ -16,11 +17,23 @@ REQUIRED_COLUMNS = [
     "notes",           # optional freeform notes
 ]
 
-def validate_columns(df: pd.DataFrame) -> None:
-    missing = [c for c in REQUIRED_COLUMNS if c not in df.columns]
+def validate_columns_from_header(header: List[str]) -> None:
+    """Check a header row against REQUIRED_COLUMNS (case and whitespace insensitive)."""
+    present = [str(c).strip().lower() for c in header]
+    seen = set(present)
+    missing = [c for c in REQUIRED_COLUMNS if c not in seen]
     if missing:
         raise ValueError(f"Input file missing required columns: {missing}. "
-                         f"Present: {list(df.columns)}")
+                         f"Present: {present}")
+
+def validate_columns(df: pd.DataFrame) -> None:
+    validate_columns_from_header(list(df.columns))
+
+def sniff_csv_header(input_path: str) -> List[str]:
+    """Read only the first non-blank CSV record, without loading the file."""
+    with open(input_path, newline="", encoding="utf-8-sig") as f:
+        # blank lines parse as []; skip them like pandas' skip_blank_lines does
+        return next((row for row in csv.reader(f) if row), [])
 
 def read_input_file(input_path: str) -> List[Dict[str, Any]]:
     """
@@ -36,6 +49,8 @@ def read_input_file(input_path: str) -> List[Dict[str, Any]]:
     if lower.endswith(".xlsx") or lower.endswith(".xlsm"):
         df = pd.read_excel(input_path)
     elif lower.endswith(".csv"):
+        # Reject bad headers before paying for a full pandas parse
+        validate_columns_from_header(sniff_csv_header(input_path))
         df = pd.read_csv(input_path)
     else:
         raise ValueError("Unsupported input format. Please upload .xlsx or .csv")
@@ -2,8 +2,12 @@
 # Minimal single-file runner for Step 1 (website-only enrichment, general mode).
 
 import csv, os, requests, json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from bs4 import BeautifulSoup
 from openai import OpenAI
+from tenacity import retry, stop_after_attempt, wait_exponential
 
 PROMPT = """You are a research assistant preparing structured notes.
 Sources:
@@ -24,11 +28,17 @@ def html_to_text(html: str, max_chars: int = 3000) -> str:
     bits = [t.get_text(" ", strip=True) for t in soup.find_all(["h1","h2","h3","p","li"])]
     return (" ".join(bits))[:max_chars]
 
-def summarize(sources_text: str) -> dict:
+@lru_cache(maxsize=1)
+def _openai_client():
     api = os.getenv("OPENAI_API_KEY")
-    if not api:
+    # retries are owned by summarize()'s tenacity policy, not stacked on the client's own
+    return OpenAI(api_key=api, max_retries=0) if api else None
+
+@retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=8))
+def summarize(sources_text: str) -> dict:
+    client = _openai_client()
+    if client is None:
         return {"company_focus":"Unknown","recent_activity":"Unknown","positioning_hook":"General benefits"}
-    client = OpenAI(api_key=api)
     resp = client.chat.completions.create(
         model="gpt-4o-mini",
         messages=[{"role":"user","content":PROMPT.format(sources=sources_text)}],
@@ -40,25 +50,37 @@ def summarize(sources_text: str) -> dict:
     except Exception:
         return {"raw": resp.choices[0].message.content}
 
+SUMMARY_FIELDS = ["company_focus", "recent_activity", "positioning_hook"]
+WORKERS = max(1, int(os.getenv("QUICKSTART_WORKERS", "4")))
+
+def enrich_row(row: dict) -> dict:
+    url = row.get("website","")
+    html = fetch(url) if url else ""
+    text = html_to_text(html) if html else ""
+    sources = f"URL: {url}\nTEXT: {text}"
+    summary = summarize(sources)
+    return {**row, **{k: summary.get(k,"") for k in SUMMARY_FIELDS}}
+
+def ordered_map(fn, items, workers: int = WORKERS):
+    """Like map(), but runs fn on a thread pool with a bounded window; preserves input order."""
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        window = deque()
+        for item in items:
+            window.append(pool.submit(fn, item))
+            if len(window) >= workers * 2:
+                yield window.popleft().result()
+        while window:
+            yield window.popleft().result()
+
 def run(input_csv: str, output_csv: str):
-    out_rows = []
-    with open(input_csv, newline='', encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            url = row.get("website","")
-            html = fetch(url) if url else ""
-            text = html_to_text(html) if html else ""
-            sources = f"URL: {url}\nTEXT: {text}"
-            summary = summarize(sources)
-            out = {**row, **{
-                "company_focus": summary.get("company_focus",""),
-                "recent_activity": summary.get("recent_activity",""),
-                "positioning_hook": summary.get("positioning_hook",""),
-            }}
-            out_rows.append(out)
-    fieldnames = list(out_rows[0].keys()) if out_rows else []
-    with open(output_csv, "w", newline='', encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=fieldnames); w.writeheader(); w.writerows(out_rows)
+    # Stream: rows are written in input order as they finish; at most 2*WORKERS are held
+    with open(input_csv, newline='', encoding="utf-8") as fin, \
+         open(output_csv, "w", newline='', encoding="utf-8") as fout:
+        reader = csv.DictReader(fin)
+        in_fields = list(reader.fieldnames or [])
+        fieldnames = in_fields + [k for k in SUMMARY_FIELDS if k not in in_fields]
+        w = csv.DictWriter(fout, fieldnames=fieldnames); w.writeheader()
+        w.writerows(ordered_map(enrich_row, reader))  # rows are network-bound: overlap the waits
     print("Wrote", output_csv)
 
 if __name__ == "__main__":
@@ -3,27 +3,28 @@
 # Integrated with Supabase Storage and background worker
 
 import os
-import json
-import uuid
-import threading
+import sys
+import atexit
+import logging
+import logging.handlers
 import queue
 from datetime import datetime, timezone
 from typing import Optional, List, Dict, Any
+import orjson
 import requests
 import traceback
 from fastapi import FastAPI, UploadFile, File, Form, HTTPException, Depends, Request, Header, Path
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from dotenv import load_dotenv
 from starlette.middleware.base import BaseHTTPMiddleware
 from supabase import create_client
 
-# ✅ Diagnostic: confirm parser file visibility at runtime
-print("DEBUG: backend/parser.py exists?", os.path.exists("backend/parser.py"))
-
 # 🧩 FIXED IMPORT PATHS (after renaming app → backend)
-from backend.input_parser import read_input_file, validate_columns
+from parser import read_input_file, validate_columns
 from auth import router as auth_router, get_current_user, User
+from health import router as health_router
 from backend.db_helper import create_job, update_job, get_job, list_jobs
 from backend.pipeline import run_pipeline  # ✅ key fix
 
@@ -36,7 +37,7 @@ ROOT = os.getcwd()
 UPLOADS_DIR = os.path.join(ROOT, "uploads")
 OUTPUTS_DIR = os.path.join(ROOT, "outputs")
 DOWNLOADS_DIR = os.path.join(ROOT, "downloads")
-LOG_FILE = os.path.join(ROOT, "logging.json")
+LOG_FILE = os.path.join(ROOT, "logging.jsonl")
 JOBS_FILE = os.path.join(ROOT, "jobs.json")
 
 os.makedirs(UPLOADS_DIR, exist_ok=True)
@@ -45,11 +46,10 @@ os.makedirs(DOWNLOADS_DIR, exist_ok=True)
 
 def _ensure_json(path: str, default):
     if not os.path.exists(path):
-        with open(path, "w") as f:
-            json.dump(default, f)
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(default))
 
 _ensure_json(JOBS_FILE, [])
-_ensure_json(LOG_FILE, [])
 
 load_dotenv()
 PUBLIC_READ = os.getenv("PUBLIC_READ", "1") == "1"
@@ -70,40 +70,137 @@ supabase = create_client(SUPABASE_URL, SUPABASE_SERVICE_KEY)
 def now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
-def _read_json(path: str, fallback):
-    try:
-        with open(path, "r") as f:
-            return json.load(f)
-    except Exception:
-        return fallback
-
-def _write_json(path: str, data):
-    with open(path, "w") as f:
-        json.dump(data, f, indent=2)
+# Event log: callers only enqueue; a listener thread owns the file (one JSON object per line)
+# and the console echo, so request handlers never block on disk or stdout.
+class _BatchedFileHandler(logging.Handler):
+    """
+    Buffers encoded lines; flush_batch appends the whole burst with one write() on an
+    O_APPEND fd, so lines from several processes never interleave mid-line.
+    """
+    max_buffer = 1 << 20
+
+    def __init__(self, path: str):
+        super().__init__()
+        self._fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        self._lines: List[bytes] = []
+        self._size = 0
+
+    def encode(self, record) -> bytes:
+        return (self.format(record) + "\n").encode("utf-8")
+
+    def emit(self, record):
+        try:
+            line = self.encode(record)
+        except Exception:
+            self.handleError(record)
+            return
+        self._lines.append(line)
+        self._size += len(line)
+        if self._size >= self.max_buffer:
+            self.flush_batch()
+
+    def flush_batch(self):
+        with self.lock:
+            if not self._lines:
+                return
+            data = memoryview(b"".join(self._lines))
+            self._lines.clear()
+            self._size = 0
+            while data:
+                data = data[os.write(self._fd, data):]
+
+    def close(self):
+        with self.lock:
+            if self._fd is not None:
+                self.flush_batch()
+                os.close(self._fd)
+                self._fd = None
+        super().close()
+
+class _BatchedStreamHandler(logging.StreamHandler):
+    """Skips the per-record flush; the listener flushes once per drained burst."""
+    def flush(self):
+        pass
+
+    def flush_batch(self):
+        super().flush()
+
+class _JsonLinesHandler(_BatchedFileHandler):
+    """Encodes the event dict attached by log_event straight to bytes, exactly once."""
+    def encode(self, record) -> bytes:
+        entry = getattr(record, "entry", None)
+        if entry is None:
+            return super().encode(record)
+        return orjson.dumps(entry, default=str, option=orjson.OPT_APPEND_NEWLINE)
+
+class _ConsoleFormatter(logging.Formatter):
+    """Human-readable echo of an event: `[level] message {extra}`."""
+    def format(self, record):
+        entry = getattr(record, "entry", None)
+        if entry is None:
+            return super().format(record)
+        return f"[{entry['level']}] {entry['message']} {record.fields or ''}"
+
+class _BatchingQueueListener(logging.handlers.QueueListener):
+    def handle(self, record):
+        super().handle(record)
+        if self.queue.empty():
+            self.flush_batch()
+
+    def flush_batch(self):
+        for handler in self.handlers:
+            handler.flush_batch()
+
+    def stop(self):
+        # the stop sentinel keeps the queue non-empty, so flush the final burst here
+        super().stop()
+        self.flush_batch()
+
+_log_q: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+# Append-only, no in-process rotation: every process importing this module (uvicorn
+# workers, worker.py) appends to the same file. Rotate externally (copytruncate).
+_log_file_handler = _JsonLinesHandler(LOG_FILE)
+_log_file_handler.setFormatter(logging.Formatter("%(message)s"))
+_log_console_handler = _BatchedStreamHandler(sys.stdout)
+_log_console_handler.setFormatter(_ConsoleFormatter("%(message)s"))
+_log_listener = _BatchingQueueListener(_log_q, _log_file_handler, _log_console_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+_event_logger = logging.getLogger("outreach.events")
+_event_logger.addHandler(logging.handlers.QueueHandler(_log_q))
+_event_logger.setLevel(logging.DEBUG)  # the event log records every level
+_event_logger.propagate = False
 
 def log_event(level: str, message: str, **extra):
-    logs = _read_json(LOG_FILE, [])
     entry = {"time": now_iso(), "level": level, "message": message}
     if extra:
         entry.update(extra)
-    logs.append(entry)
-    _write_json(LOG_FILE, logs)
-    print(f"[{level}] {message} {extra if extra else ''}")
+    # the dict rides on the record; it is serialized once, off the request path
+    levelno = logging.getLevelName(level.upper())
+    _event_logger.log(
+        levelno if isinstance(levelno, int) else logging.INFO,
+        message,
+        extra={"entry": entry, "fields": extra},
+    )
 
 # -------------------------------------------------------------------
 # FastAPI app setup
 # -------------------------------------------------------------------
-app = FastAPI(title="AI Outreach Agent", version=APP_VERSION)
+app = FastAPI(title="AI Outreach Agent", version=APP_VERSION, default_response_class=ORJSONResponse)
+
+# frozenset: Starlette checks `origin in allow_origins` on every CORS request
+ALLOWED_ORIGINS = frozenset({
+    "https://signal-job.lovable.app",
+    "https://lovable.app",
+    "https://lovableproject.com",
+    "http://localhost:5173",
+    "http://127.0.0.1:5173",
+})
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "https://signal-job.lovable.app",
-        "https://lovable.app",
-        "https://lovableproject.com",
-        "http://localhost:5173",
-        "http://127.0.0.1:5173",
-    ],
+    allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -112,13 +209,14 @@ app.add_middleware(
 
 class RequestIDMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request, call_next):
-        req_id = request.headers.get("X-Request-ID") or uuid.uuid4().hex
+        req_id = request.headers.get("X-Request-ID") or os.urandom(16).hex()
         response = await call_next(request)
         response.headers["X-Request-ID"] = req_id
         return response
 
 app.add_middleware(RequestIDMiddleware)
 app.include_router(auth_router)
+app.include_router(health_router)
 
 # -------------------------------------------------------------------
 # (Remaining functions unchanged)
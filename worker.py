@@ -2,48 +2,62 @@
 worker.py
 Continuous job processor for AI Outreach Agent.
 Polls the Supabase 'jobs' table for queued jobs and processes them using server.process_job.
+Up to WORKER_CONCURRENCY jobs run at once so their network waits overlap.
 Safe for multi-tenant Lovable + Supabase setup.
 """
 
 import os
 import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from dotenv import load_dotenv
 
-from backend.db_helper import list_jobs, update_job, get_job
+from backend.db_helper import claim_next_job, update_job, get_job
 from server import process_job, log_event, now_iso
 
 load_dotenv()
 
 # Polling interval (in seconds)
 POLL_INTERVAL = int(os.getenv("WORKER_POLL_INTERVAL", "30"))
+# Jobs processed in parallel by this worker
+WORKER_CONCURRENCY = max(1, int(os.getenv("WORKER_CONCURRENCY", "4")))
+
+def run_job(job_id):
+    try:
+        process_job(job_id)
+        print(f"✅ Job {job_id} completed.")
+    except Exception as job_err:
+        err = traceback.format_exc()
+        print(f"❌ Job {job_id} failed: {err}")
+        update_job(job_id, status="failed", error=str(job_err), updated_at=now_iso())
+        log_event("ERROR", "Worker job failure", job_id=job_id, error=str(job_err))
 
 def main():
-    print("🚀 Worker started: polling Supabase for queued jobs...")
-    while True:
-        try:
-            jobs = list_jobs()
-            queued = [j for j in jobs if j.get("status") == "queued"]
-            if queued:
-                print(f"🔄 Found {len(queued)} queued job(s) to process.")
-            for job in queued:
-                job_id = job.get("id")
-                print(f"⚙️ Processing job {job_id} ({job.get('filename')})")
-                try:
-                    update_job(job_id, status="processing", updated_at=now_iso())
-                    process_job(job_id)
-                    print(f"✅ Job {job_id} completed.")
-                except Exception as job_err:
-                    err = traceback.format_exc()
-                    print(f"❌ Job {job_id} failed: {err}")
-                    update_job(job_id, status="failed", error=str(job_err), updated_at=now_iso())
-                    log_event("ERROR", "Worker job failure", job_id=job_id, error=str(job_err))
-            time.sleep(POLL_INTERVAL)
-        except Exception as loop_err:
-            err = traceback.format_exc()
-            print(f"🔥 Worker loop error: {err}")
-            log_event("ERROR", "Worker main loop failure", error=str(loop_err))
-            time.sleep(POLL_INTERVAL)
+    print(f"🚀 Worker started: polling Supabase for queued jobs ({WORKER_CONCURRENCY} slots)...")
+    in_flight = set()
+    with ThreadPoolExecutor(max_workers=WORKER_CONCURRENCY, thread_name_prefix="job") as pool:
+        while True:
+            try:
+                in_flight = {f for f in in_flight if not f.done()}
+                free = WORKER_CONCURRENCY - len(in_flight)
+                # one atomic claim per free slot; concurrent workers never get the same job
+                for _ in range(free):
+                    job = claim_next_job()
+                    if not job:
+                        break
+                    job_id = job.get("id")
+                    print(f"⚙️ Processing job {job_id} ({job.get('filename')})")
+                    in_flight.add(pool.submit(run_job, job_id))
+                # wake early when a slot frees up instead of always sleeping a full interval
+                if in_flight:
+                    wait(in_flight, timeout=POLL_INTERVAL, return_when=FIRST_COMPLETED)
+                else:
+                    time.sleep(POLL_INTERVAL)
+            except Exception as loop_err:
+                err = traceback.format_exc()
+                print(f"🔥 Worker loop error: {err}")
+                log_event("ERROR", "Worker main loop failure", error=str(loop_err))
+                time.sleep(POLL_INTERVAL)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()